@@ -1,4 +1,5 @@
-from flask import Flask, render_template, request, jsonify
+import json
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 from models.extractive import ExtractiveTextSummarizer
 from models.abstractive import AbstractiveTextSummarizer
 
@@ -15,6 +16,11 @@ app = Flask(__name__)
 extractive_summarizer = ExtractiveTextSummarizer()
 abstractive_summarizer = AbstractiveTextSummarizer()
 
+# Allowed chunk sizes (in characters) for the streaming endpoint
+DEFAULT_CHUNK_SIZE = 2000
+MIN_CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 10000
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -47,5 +53,119 @@ def summarize():
         app.logger.error(f"Request processing error: {str(e)}")
         return jsonify({'error': f'Request processing failed: {str(e)}'}), 500
 
+def _sse(event, data):
+    """
+    Format a Server-Sent Events message.
+    
+    Args:
+        event (str): The event name
+        data (dict): The JSON-serializable payload
+        
+    Returns:
+        str: The encoded event
+    """
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def _stream_summaries(text, method, ratio, chunk_size):
+    """
+    Summarize the text progressively, yielding events as results become available.
+    
+    The text is split into sentence-boundary chunks and each chunk is summarized
+    on its own, so a preview arrives after a fraction of the total work. Each
+    partial event carries only the new chunk's summary. The final summaries are
+    then computed over the whole text, so they match the /summarize endpoint.
+    
+    Work only happens between yields, so when the client disconnects the
+    generator is closed at the next yield and no further steps are run.
+    
+    Args:
+        text (str): The text to summarize
+        method (str): "extractive", "abstractive" or "both"
+        ratio (float): The ratio of the original text to keep
+        chunk_size (int): Maximum size of each chunk in characters
+        
+    Yields:
+        str: Encoded Server-Sent Events
+    """
+    summarizers = []
+    if method in ['extractive', 'both']:
+        summarizers.append(('extractive', extractive_summarizer))
+    if method in ['abstractive', 'both']:
+        summarizers.append(('abstractive', abstractive_summarizer))
+    
+    try:
+        yield _sse('progress', {'stage': 'chunking'})
+        chunks = abstractive_summarizer.chunk_text(text, max_chunk_size=chunk_size)
+        
+        if len(chunks) > 1:
+            for i, chunk in enumerate(chunks):
+                yield _sse('progress', {'stage': 'chunk', 'chunk': i + 1, 'total': len(chunks)})
+                for name, summarizer in summarizers:
+                    summary = summarizer.summarize(chunk, ratio=ratio)
+                    if _is_failed_summary(summarizer, summary):
+                        yield _sse('error', {'error': f'Summarization failed: {name} summarizer error'})
+                        return
+                    yield _sse('partial', {
+                        'method': name,
+                        'chunk': i + 1,
+                        'total': len(chunks),
+                        'summary': summary
+                    })
+        
+        for name, summarizer in summarizers:
+            yield _sse('progress', {'stage': name})
+            summary = summarizer.summarize(text, ratio=ratio)
+            if _is_failed_summary(summarizer, summary):
+                yield _sse('error', {'error': f'Summarization failed: {name} summarizer error'})
+                return
+            yield _sse('summary', {'method': name, 'summary': summary})
+        
+        yield _sse('done', {})
+    except GeneratorExit:
+        app.logger.info("Client disconnected, stopping summarization")
+        raise
+    except Exception as e:
+        app.logger.error(f"Summarization error: {str(e)}")
+        yield _sse('error', {'error': f'Summarization failed: {str(e)}'})
+
+def _is_failed_summary(summarizer, summary):
+    """
+    Check for the placeholder the abstractive summarizer returns on failure.
+    
+    Args:
+        summarizer: The summarizer that produced the summary
+        summary (str): The summary to check
+        
+    Returns:
+        bool: True if the summary is a failure placeholder
+    """
+    return summary == getattr(summarizer, 'ERROR_SUMMARY', None)
+
+@app.route('/summarize/stream', methods=['POST'])
+def summarize_stream():
+    try:
+        data = request.json
+        text = data.get('text', '')
+        method = data.get('method', 'both')
+        ratio = float(data.get('ratio', 0.3))
+        chunk_size = data.get('chunk_size', DEFAULT_CHUNK_SIZE)
+        
+        if not text:
+            return jsonify({'error': 'No text provided'}), 400
+        
+        # bool is a subclass of int, so rule it out explicitly
+        if (isinstance(chunk_size, bool) or not isinstance(chunk_size, int)
+                or not MIN_CHUNK_SIZE <= chunk_size <= MAX_CHUNK_SIZE):
+            return jsonify({'error': f'chunk_size must be an integer between {MIN_CHUNK_SIZE} and {MAX_CHUNK_SIZE}'}), 400
+        
+        return Response(
+            stream_with_context(_stream_summaries(text, method, ratio, chunk_size)),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+    except Exception as e:
+        app.logger.error(f"Request processing error: {str(e)}")
+        return jsonify({'error': f'Request processing failed: {str(e)}'}), 500
+
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
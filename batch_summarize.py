@@ -0,0 +1,458 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import sys
+from collections import deque
+
+"""
+Offline bulk summarization for large document collections.
+
+Streams a directory of text files or a JSONL corpus through the extractive
+and/or abstractive summarizers using a pool of worker processes, and writes
+results incrementally to a JSONL file or a SQLite database. Progress is
+checkpointed after every batch so an interrupted run can be resumed.
+
+Example:
+    python batch_summarize.py corpus.jsonl summaries.jsonl --workers 8
+    python batch_summarize.py docs/ summaries.db --method extractive --resume
+"""
+
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                    handlers=[logging.StreamHandler()])
+logger = logging.getLogger(__name__)
+
+# Summarizers are created once per worker process by _init_worker
+_summarizers = {}
+_init_error = None
+
+
+def iter_documents(source, id_field='id', text_field='text', extensions=('.txt',), skip=0):
+    """
+    Lazily yield (doc_id, text, error) tuples from a directory or a JSONL file.
+
+    Directory entries are visited in sorted order so that the sequence is
+    stable between runs, which is what makes resuming by position possible.
+    The first ``skip`` documents are counted without being read or parsed.
+
+    A JSONL line that cannot be parsed into an object still yields a tuple,
+    with an error message in place of the text, so that every input line
+    keeps its position.
+
+    Args:
+        source (str): Path to a directory of text files or a JSONL file
+        id_field (str): JSONL key holding the document id
+        text_field (str): JSONL key holding the document text
+        extensions (tuple): File extensions to pick up when walking a directory
+        skip (int): Number of leading documents to pass over
+
+    Yields:
+        tuple: (doc_id, text, error), where error is None for valid documents
+    """
+    position = 0
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if not name.endswith(extensions):
+                    continue
+                position += 1
+                if position <= skip:
+                    continue
+                path = os.path.join(root, name)
+                with open(path, encoding='utf-8', errors='replace') as f:
+                    yield os.path.relpath(path, source), f.read(), None
+    else:
+        with open(source, encoding='utf-8', errors='replace') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                position += 1
+                if position <= skip:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield f'line:{line_number}', None, f'Invalid JSON: {e}'
+                    continue
+                if not isinstance(record, dict):
+                    yield f'line:{line_number}', None, 'Invalid record: expected a JSON object'
+                    continue
+                doc_id = record.get(id_field, line_number)
+                yield str(doc_id), record.get(text_field, ''), None
+
+
+def _load_summarizers(method):
+    """
+    Build the summarizers needed for the given method in this process.
+
+    Args:
+        method (str): "extractive", "abstractive" or "both"
+    """
+    from models.extractive import ExtractiveTextSummarizer
+    from models.abstractive import AbstractiveTextSummarizer
+
+    if method in ['extractive', 'both']:
+        _summarizers['extractive'] = ExtractiveTextSummarizer()
+    if method in ['abstractive', 'both']:
+        _summarizers['abstractive'] = AbstractiveTextSummarizer()
+
+
+def _init_worker(method):
+    """
+    Pool initializer that loads the summarizers in a worker process.
+
+    An exception raised here would make the pool respawn the worker forever,
+    so it is recorded instead and raised by the first document the worker
+    handles, which stops the run.
+
+    Args:
+        method (str): "extractive", "abstractive" or "both"
+    """
+    global _init_error
+    try:
+        _load_summarizers(method)
+    except Exception as e:
+        _init_error = f'Failed to load summarizers: {e}'
+
+
+def _summarize_document(doc_id, text, ratio, error=None):
+    """
+    Summarize a single document with every summarizer loaded in this process.
+
+    Args:
+        doc_id (str): The document id
+        text (str): The document text
+        ratio (float): The ratio of the original text to keep
+        error (str): Input error for this document; skips summarization
+
+    Returns:
+        dict: Result record with the id, one key per method and an error field
+
+    Raises:
+        RuntimeError: If this worker failed to load the summarizers
+    """
+    # Not a per-document failure: stop rather than record every document as failed
+    if _init_error:
+        raise RuntimeError(_init_error)
+    result = {'id': doc_id, 'error': error}
+    if error:
+        return result
+    try:
+        for name, summarizer in _summarizers.items():
+            summary = summarizer.summarize(text, ratio=ratio)
+            # The abstractive summarizer reports failures as a placeholder summary
+            if summary == getattr(summarizer, 'ERROR_SUMMARY', None):
+                result['error'] = f'{name} summarization failed'
+                summary = None
+            result[name] = summary
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+class JSONLWriter:
+    """
+    Append results to a JSONL file, checkpointing to a sidecar file.
+
+    The checkpoint records how many input documents have been written, the
+    byte offset of the output at that point and the run settings. On resume
+    the output is truncated back to that offset so a crash mid-batch never
+    leaves duplicated or half-written lines behind.
+    """
+
+    def __init__(self, path, settings, resume=False):
+        self.path = path
+        self.checkpoint_path = path + '.checkpoint'
+        self.settings = settings
+        self.completed = 0
+
+        offset = 0
+        if not resume:
+            _remove_files(self.checkpoint_path)
+        elif os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, encoding='utf-8') as f:
+                checkpoint = json.load(f)
+            _check_settings(checkpoint.get('settings'), settings)
+            self.completed = checkpoint['completed']
+            offset = checkpoint['offset']
+            if not os.path.exists(path):
+                raise ValueError(f"Cannot resume: checkpoint found but output {path} is missing")
+            if offset > os.path.getsize(path):
+                raise ValueError(f"Cannot resume: output {path} is shorter than its checkpoint")
+
+        mode = 'r+' if resume and os.path.exists(path) else 'w'
+        self.file = open(path, mode, encoding='utf-8')
+        self.file.seek(offset)
+        self.file.truncate()
+
+    def write_batch(self, results):
+        for result in results:
+            self.file.write(json.dumps(result, ensure_ascii=False) + '\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.completed += len(results)
+
+        # Write the checkpoint atomically so it is never seen half-written
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'completed': self.completed,
+                'offset': self.file.tell(),
+                'settings': self.settings
+            }, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def close(self):
+        self.file.close()
+
+
+class SQLiteWriter:
+    """
+    Insert results into a SQLite database, one transaction per batch.
+
+    Rows are keyed by their position in the input rather than by document
+    id, since ids are not guaranteed to be unique. The checkpoint is stored
+    in the same database and updated in the same transaction as the results,
+    so the two can never disagree.
+    """
+
+    def __init__(self, path, settings, resume=False):
+        self.path = path
+        self.settings = settings
+        if not resume:
+            # Leftover WAL files from an earlier run would be replayed into the new database
+            _remove_files(path, path + '-wal', path + '-shm', path + '-journal')
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS summaries '
+            '(position INTEGER PRIMARY KEY, id TEXT, extractive TEXT, abstractive TEXT, error TEXT)'
+        )
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS checkpoint '
+            '(key TEXT PRIMARY KEY, completed INTEGER NOT NULL, settings TEXT NOT NULL)'
+        )
+        self.conn.commit()
+
+        row = self.conn.execute(
+            "SELECT completed, settings FROM checkpoint WHERE key = 'progress'"
+        ).fetchone()
+        self.completed = 0
+        if row:
+            try:
+                _check_settings(json.loads(row[1]), settings)
+            except ValueError:
+                self.conn.close()
+                raise
+            self.completed = row[0]
+
+    def write_batch(self, results):
+        start = self.completed
+        self.completed += len(results)
+        with self.conn:
+            self.conn.executemany(
+                'INSERT INTO summaries (position, id, extractive, abstractive, error) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [(start + i + 1, r['id'], r.get('extractive'), r.get('abstractive'), r['error'])
+                 for i, r in enumerate(results)]
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO checkpoint (key, completed, settings) VALUES ('progress', ?, ?)",
+                (self.completed, json.dumps(self.settings))
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+def _remove_files(*paths):
+    """
+    Delete the given files, ignoring any that do not exist.
+
+    Args:
+        *paths (str): Paths to delete
+    """
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _check_settings(saved, settings):
+    """
+    Refuse to resume a run whose checkpoint was made with other settings.
+
+    Args:
+        saved (dict): Settings stored in the checkpoint
+        settings (dict): Settings of the current run
+
+    Raises:
+        ValueError: If any setting differs
+    """
+    saved = saved or {}
+    changed = sorted(key for key in settings if saved.get(key) != settings[key])
+    if changed:
+        details = ', '.join(f"{key}={saved.get(key)!r} (now {settings[key]!r})" for key in changed)
+        raise ValueError(f"Cannot resume: checkpoint was made with different settings: {details}")
+
+
+def open_writer(path, settings, resume=False):
+    """
+    Pick an output writer based on the file extension.
+
+    Args:
+        path (str): Output path; .db, .sqlite and .sqlite3 select SQLite
+        settings (dict): Run settings recorded with the checkpoint
+        resume (bool): Continue from an existing checkpoint
+
+    Returns:
+        JSONLWriter or SQLiteWriter: The output writer
+    """
+    if path.endswith(('.db', '.sqlite', '.sqlite3')):
+        return SQLiteWriter(path, settings, resume=resume)
+    return JSONLWriter(path, settings, resume=resume)
+
+
+def run(source, output, method='both', ratio=0.3, workers=None, batch_size=100,
+        resume=False, id_field='id', text_field='text'):
+    """
+    Summarize every document in source and write the results to output.
+
+    At most ``workers * 4`` documents are in flight at any time, so memory
+    use stays bounded however large the corpus is. Results are written in
+    input order, which lets a resumed run skip exactly the documents that
+    were already checkpointed. Resuming is refused if the source, method,
+    ratio or JSONL fields differ from the checkpointed run.
+
+    Args:
+        source (str): Directory of text files or a JSONL file
+        output (str): JSONL or SQLite output path
+        method (str): "extractive", "abstractive" or "both"
+        ratio (float): The ratio of the original text to keep
+        workers (int): Number of worker processes; 1 runs in-process
+        batch_size (int): Number of results per write and checkpoint
+        resume (bool): Continue from an existing checkpoint
+        id_field (str): JSONL key holding the document id
+        text_field (str): JSONL key holding the document text
+
+    Returns:
+        int: Total number of documents completed
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    # Load the summarizers here first so that setup errors fail fast,
+    # before the output is touched or any worker is started
+    _load_summarizers(method)
+    settings = {
+        'source': os.path.abspath(source),
+        'method': method,
+        'ratio': ratio,
+        'id_field': id_field,
+        'text_field': text_field
+    }
+    writer = open_writer(output, settings, resume=resume)
+    skip = writer.completed
+    if skip:
+        logger.info(f"Resuming after {skip} completed documents")
+
+    documents = iter_documents(source, id_field=id_field, text_field=text_field, skip=skip)
+
+    batch = []
+    pool = None
+    try:
+        if workers == 1:
+            results = (_summarize_document(doc_id, text, ratio, error)
+                       for doc_id, text, error in documents)
+        else:
+            pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(method,))
+            results = _bounded_imap(pool, documents, ratio, max_pending=workers * 4)
+
+        for result in results:
+            if result['error']:
+                logger.warning(f"Failed to summarize {result['id']}: {result['error']}")
+            batch.append(result)
+            if len(batch) >= batch_size:
+                writer.write_batch(batch)
+                batch = []
+                logger.info(f"Completed {writer.completed} documents")
+
+        if batch:
+            writer.write_batch(batch)
+    finally:
+        if pool is not None:
+            pool.terminate()
+        writer.close()
+
+    logger.info(f"Finished: {writer.completed} documents summarized")
+    return writer.completed
+
+
+def _bounded_imap(pool, documents, ratio, max_pending):
+    """
+    Like Pool.imap, but never reads more than max_pending documents ahead.
+
+    Pool.imap drains its input iterator eagerly, which would pull the whole
+    corpus into memory, so tasks are submitted one at a time instead.
+
+    Args:
+        pool (multiprocessing.Pool): The worker pool
+        documents (iterator): (doc_id, text, error) tuples
+        ratio (float): The ratio of the original text to keep
+        max_pending (int): Maximum number of documents in flight
+
+    Yields:
+        dict: Result records, in input order
+    """
+    pending = deque()
+    for doc_id, text, error in documents:
+        pending.append(pool.apply_async(_summarize_document, (doc_id, text, ratio, error)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Summarize a corpus of documents in bulk.')
+    parser.add_argument('source', help='Directory of .txt files or a JSONL file')
+    parser.add_argument('output', help='Output path (.jsonl, or .db/.sqlite/.sqlite3 for SQLite)')
+    parser.add_argument('--method', choices=['extractive', 'abstractive', 'both'], default='both')
+    parser.add_argument('--ratio', type=float, default=0.3,
+                        help='Proportion of original text to keep (default: 0.3)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--batch-size', type=int, default=100,
+                        help='Documents per write and checkpoint (default: 100)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted run instead of starting over')
+    parser.add_argument('--id-field', default='id', help='JSONL key holding the document id')
+    parser.add_argument('--text-field', default='text', help='JSONL key holding the document text')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.source):
+        parser.error(f"Source not found: {args.source}")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    try:
+        run(args.source, args.output, method=args.method, ratio=args.ratio,
+            workers=args.workers, batch_size=args.batch_size, resume=args.resume,
+            id_field=args.id_field, text_field=args.text_field)
+    except (ValueError, RuntimeError) as e:
+        logger.error(str(e))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,6 +8,9 @@ import heapq
 import random
 
 class AbstractiveTextSummarizer:
+    # Returned by summarize() in place of a summary when summarization fails
+    ERROR_SUMMARY = "Error generating summary. Please try again."
+    
     def __init__(self):
         # Download necessary NLTK data
         try:
@@ -85,7 +88,7 @@ class AbstractiveTextSummarizer:
             return summary
         except Exception as e:
             print(f"Error in abstractive summarization: {e}")
-            return "Error generating summary. Please try again."
+            return self.ERROR_SUMMARY
     
     def _enhance_coherence(self, sentences):
         """
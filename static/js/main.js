@@ -11,6 +11,20 @@ document.addEventListener('DOMContentLoaded', function() {
     const extractiveLength = document.getElementById('extractive-length');
     const abstractiveLength = document.getElementById('abstractive-length');
     const copyButtons = document.querySelectorAll('.copy-btn');
+    const progressStatus = document.getElementById('progress-status');
+    const summaryViews = {
+        extractive: {
+            tab: document.getElementById('extractive-tab'),
+            content: extractiveContent,
+            length: extractiveLength,
+        },
+        abstractive: {
+            tab: document.getElementById('abstractive-tab'),
+            content: abstractiveContent,
+            length: abstractiveLength,
+        },
+    };
+    let activeRequest = null;
     
     // Update ratio value display
     ratioSlider.addEventListener('input', function() {
@@ -44,8 +58,31 @@ document.addEventListener('DOMContentLoaded', function() {
         summarizeBtn.disabled = true;
         summarizeBtn.innerHTML = '<span class="spinner-border spinner-border-sm" role="status" aria-hidden="true"></span> Processing...';
         
-        // Send request to server
-        fetch('/summarize', {
+        // Cancel any summary still streaming so the server stops working on it
+        if (activeRequest) {
+            activeRequest.abort();
+        }
+        const controller = new AbortController();
+        activeRequest = controller;
+        
+        // Show the results card straight away and fill it in as events arrive
+        const originalWords = text.split(/\s+/).length;
+        originalLength.textContent = `${originalWords} words`;
+        resultsCard.classList.remove('d-none');
+        for (const [name, view] of Object.entries(summaryViews)) {
+            if (method === 'both' || method === name) {
+                view.tab.classList.remove('d-none');
+                view.content.textContent = '';
+                view.length.textContent = '0 words';
+            } else {
+                view.tab.classList.add('d-none');
+            }
+        }
+        let scrolled = false;
+        let finished = false;
+        
+        // Send request to server and render each update as it arrives
+        fetch('/summarize/stream', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -55,58 +92,127 @@ document.addEventListener('DOMContentLoaded', function() {
                 method: method,
                 ratio: ratio
             }),
+            signal: controller.signal,
         })
         .then(response => {
             if (!response.ok) {
                 throw new Error('Network response was not ok');
             }
-            return response.json();
+            return readEventStream(response, (event, data) => {
+                if (event === 'progress') {
+                    progressStatus.classList.remove('d-none');
+                    progressStatus.textContent = describeProgress(data);
+                } else if (event === 'partial' || event === 'summary') {
+                    renderSummary(data.method, data.summary, originalWords, event === 'partial');
+                    if (!scrolled) {
+                        resultsCard.scrollIntoView({ behavior: 'smooth' });
+                        scrolled = true;
+                    }
+                } else if (event === 'error') {
+                    throw new Error(data.error);
+                } else if (event === 'done') {
+                    finished = true;
+                }
+            });
         })
-        .then(data => {
-            // Display results
-            resultsCard.classList.remove('d-none');
-            
-            // Calculate word counts
-            const originalWords = text.split(/\s+/).length;
-            originalLength.textContent = `${originalWords} words`;
-            
-            // Update extractive summary if available
-            if (data.extractive) {
-                document.getElementById('extractive-tab').classList.remove('d-none');
-                extractiveContent.textContent = data.extractive;
-                const extractiveWords = data.extractive.split(/\s+/).length;
-                extractiveLength.textContent = `${extractiveWords} words (${Math.round(extractiveWords/originalWords*100)}%)`;
-            } else {
-                document.getElementById('extractive-tab').classList.add('d-none');
-            }
-            
-            // Update abstractive summary if available
-            if (data.abstractive) {
-                document.getElementById('abstractive-tab').classList.remove('d-none');
-                abstractiveContent.textContent = data.abstractive;
-                const abstractiveWords = data.abstractive.split(/\s+/).length;
-                abstractiveLength.textContent = `${abstractiveWords} words (${Math.round(abstractiveWords/originalWords*100)}%)`;
-            } else {
-                document.getElementById('abstractive-tab').classList.add('d-none');
+        .then(() => {
+            // The connection dropped before the server finished
+            if (!finished) {
+                throw new Error('Summary stream ended unexpectedly');
             }
-            
-            // Scroll to results
-            resultsCard.scrollIntoView({ behavior: 'smooth' });
-            
-            // Reset button state
-            summarizeBtn.disabled = false;
-            summarizeBtn.innerHTML = '<i class="fas fa-magic me-2"></i>Summarize';
+            finishRequest(controller);
         })
         .catch(error => {
+            // A newer request replaced this one; leave the UI to it
+            if (error.name === 'AbortError') {
+                return;
+            }
             console.error('Error:', error);
+            // Partial summaries will not be completed, so stop labelling them as in progress
+            for (const view of Object.values(summaryViews)) {
+                view.length.textContent = view.length.textContent.replace(', in progress', ', incomplete');
+            }
             alert('An error occurred while summarizing the text. Please try again.');
-            
-            // Reset button state
-            summarizeBtn.disabled = false;
-            summarizeBtn.innerHTML = '<i class="fas fa-magic me-2"></i>Summarize';
+            finishRequest(controller);
         });
     });
     
+    // Show a summary; partial ones are appended and marked as still in progress
+    function renderSummary(name, summary, originalWords, partial) {
+        const view = summaryViews[name];
+        if (!view) {
+            return;
+        }
+        if (partial && view.content.textContent) {
+            view.content.textContent += ' ' + summary;
+        } else {
+            view.content.textContent = summary;
+        }
+        view.content.classList.toggle('text-muted', partial);
+        const words = view.content.textContent.split(/\s+/).length;
+        const label = `${words} words (${Math.round(words/originalWords*100)}%)`;
+        view.length.textContent = partial ? `${label}, in progress` : label;
+    }
+    
+    // Describe a progress event for the status line
+    function describeProgress(data) {
+        if (data.stage === 'chunk') {
+            return `Summarizing section ${data.chunk} of ${data.total}...`;
+        }
+        if (data.stage === 'extractive' || data.stage === 'abstractive') {
+            return `Finalizing ${data.stage} summary...`;
+        }
+        return 'Preparing text...';
+    }
+    
+    // Reset the form once the given request has finished
+    function finishRequest(controller) {
+        if (activeRequest !== controller) {
+            return;
+        }
+        activeRequest = null;
+        progressStatus.classList.add('d-none');
+        summarizeBtn.disabled = false;
+        summarizeBtn.innerHTML = '<i class="fas fa-magic me-2"></i>Summarize';
+    }
+    
+    // Parse a Server-Sent Events response body, calling onEvent for each event
+    function readEventStream(response, onEvent) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        
+        function pump() {
+            return reader.read().then(({ done, value }) => {
+                if (done) {
+                    return;
+                }
+                buffer += decoder.decode(value, { stream: true });
+                let boundary;
+                while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                    const block = buffer.slice(0, boundary);
+                    buffer = buffer.slice(boundary + 2);
+                    let event = 'message';
+                    let data = '';
+                    for (const line of block.split('\n')) {
+                        if (line.startsWith('event: ')) {
+                            event = line.slice(7);
+                        } else if (line.startsWith('data: ')) {
+                            data += line.slice(6);
+                        }
+                    }
+                    onEvent(event, data ? JSON.parse(data) : {});
+                }
+                return pump();
+            });
+        }
+        
+        return pump().catch(error => {
+            reader.cancel();
+            throw error;
+        });
+    }
+    
     // Handle copy buttons
     copyButtons.forEach(button => {
         button.addEventListener('click', function() {
@@ -0,0 +1,354 @@
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import traceback
+from contextlib import contextmanager
+
+import batch_summarize
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                    handlers=[logging.StreamHandler()])
+logger = logging.getLogger(__name__)
+
+
+class StubSummarizer:
+    """Fast, deterministic stand-in so the checks run without NLTK data."""
+
+    ERROR_SUMMARY = "Error generating summary. Please try again."
+    # Raise KeyboardInterrupt after this many calls to simulate Ctrl-C
+    interrupt_after = None
+    calls = 0
+
+    def __init__(self, name):
+        self.name = name
+
+    def summarize(self, text, ratio=0.3):
+        StubSummarizer.calls += 1
+        if StubSummarizer.interrupt_after is not None and StubSummarizer.calls > StubSummarizer.interrupt_after:
+            raise KeyboardInterrupt
+        if 'fail' in text and self.name == 'abstractive':
+            return self.ERROR_SUMMARY
+        return f"{self.name}: {text[:20]}"
+
+
+def _load_stub_summarizers(method):
+    batch_summarize._summarizers.clear()
+    if method in ['extractive', 'both']:
+        batch_summarize._summarizers['extractive'] = StubSummarizer('extractive')
+    if method in ['abstractive', 'both']:
+        batch_summarize._summarizers['abstractive'] = StubSummarizer('abstractive')
+
+
+@contextmanager
+def _stub_summarizers(loader=_load_stub_summarizers):
+    """Swap in a summarizer loader for one test, restoring the module state afterwards."""
+    original_loader = batch_summarize._load_summarizers
+    batch_summarize._load_summarizers = loader
+    _reset()
+    try:
+        yield
+    finally:
+        batch_summarize._load_summarizers = original_loader
+        batch_summarize._init_error = None
+        batch_summarize._summarizers.clear()
+        _reset()
+
+
+def _reset(interrupt_after=None):
+    StubSummarizer.calls = 0
+    StubSummarizer.interrupt_after = interrupt_after
+
+
+def _write_corpus(path, count=31, bad_lines=(26,)):
+    """Write a JSONL corpus with malformed lines at the given line numbers."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(1, count + 1):
+            if i == bad_lines[0]:
+                f.write('{"id": "broken", "text": \n')
+            elif i in bad_lines:
+                f.write('["not", "an", "object"]\n')
+            else:
+                f.write(json.dumps({'id': f'doc{i}', 'text': f'Document number {i}.'}) + '\n')
+
+
+def _read_jsonl(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def _read_sqlite(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(
+            'SELECT id, extractive, abstractive, error FROM summaries ORDER BY position'
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def _as_rows(records):
+    return [(r['id'], r.get('extractive'), r.get('abstractive'), r['error']) for r in records]
+
+
+def _interrupted_run(source, output, interrupt_after, **kwargs):
+    _reset(interrupt_after=interrupt_after)
+    try:
+        batch_summarize.run(source, output, workers=1, batch_size=5, **kwargs)
+    except KeyboardInterrupt:
+        return
+    finally:
+        _reset()
+    raise AssertionError("Run was expected to be interrupted")
+
+
+def _expect_error(error_type, func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+    except error_type as e:
+        return e
+    raise AssertionError(f"Expected {error_type.__name__}")
+
+
+def test_jsonl_interrupt_and_resume():
+    logger.info("Testing JSONL interrupt and resume...")
+    with _stub_summarizers(), tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.jsonl')
+        _write_corpus(source, bad_lines=(26, 28))
+
+        expected_path = os.path.join(tmp, 'expected.jsonl')
+        assert batch_summarize.run(source, expected_path, workers=1, batch_size=5) == 31
+        expected = _read_jsonl(expected_path)
+
+        output = os.path.join(tmp, 'out.jsonl')
+        # Two summarizers per document, so 2 * 23 calls stops mid-way through a batch
+        _interrupted_run(source, output, interrupt_after=2 * 23)
+        assert len(_read_jsonl(output)) == 20
+
+        assert batch_summarize.run(source, output, workers=1, batch_size=5, resume=True) == 31
+        assert _read_jsonl(output) == expected
+
+        ids = [record['id'] for record in expected]
+        assert ids[25] == 'line:26' and expected[25]['error'].startswith('Invalid JSON')
+        assert ids[27] == 'line:28' and expected[27]['error'].startswith('Invalid record')
+        assert ids[26] == 'doc27' and expected[26]['error'] is None
+    logger.info("JSONL interrupt and resume test passed")
+
+
+def test_sqlite_interrupt_and_resume():
+    logger.info("Testing SQLite interrupt and resume...")
+    with _stub_summarizers(), tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.jsonl')
+        _write_corpus(source)
+
+        expected_path = os.path.join(tmp, 'expected.db')
+        batch_summarize.run(source, expected_path, workers=1, batch_size=5)
+        expected = _read_sqlite(expected_path)
+        assert len(expected) == 31
+
+        output = os.path.join(tmp, 'out.db')
+        _interrupted_run(source, output, interrupt_after=2 * 12)
+        assert len(_read_sqlite(output)) == 10
+
+        assert batch_summarize.run(source, output, workers=1, batch_size=5, resume=True) == 31
+        assert _read_sqlite(output) == expected
+    logger.info("SQLite interrupt and resume test passed")
+
+
+def test_duplicate_ids_are_kept():
+    logger.info("Testing that documents sharing an id are all kept...")
+    with _stub_summarizers(), tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.jsonl')
+        with open(source, 'w', encoding='utf-8') as f:
+            for doc_id, text in [('a', 'First.'), ('b', 'Second.'), ('a', 'Third.')]:
+                f.write(json.dumps({'id': doc_id, 'text': text}) + '\n')
+
+        assert batch_summarize.run(source, os.path.join(tmp, 'out.jsonl'), workers=1) == 3
+        assert batch_summarize.run(source, os.path.join(tmp, 'out.db'), workers=1) == 3
+        records = _read_jsonl(os.path.join(tmp, 'out.jsonl'))
+        assert len(records) == 3
+        assert _read_sqlite(os.path.join(tmp, 'out.db')) == _as_rows(records)
+    logger.info("Duplicate id test passed")
+
+
+def test_fresh_run_discards_old_checkpoint():
+    logger.info("Testing that a fresh run discards an old checkpoint...")
+    with _stub_summarizers(), tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.jsonl')
+        _write_corpus(source)
+
+        for name in ['out.jsonl', 'out.db']:
+            output = os.path.join(tmp, name)
+            batch_summarize.run(source, output, workers=1, batch_size=5)
+
+            # A fresh run interrupted before its first batch, then resumed
+            _interrupted_run(source, output, interrupt_after=2)
+            assert batch_summarize.run(source, output, workers=1, batch_size=5, resume=True) == 31
+            if name.endswith('.jsonl'):
+                records = _read_jsonl(output)
+                assert len(records) == 31 and records[0]['id'] == 'doc1'
+            else:
+                assert len(_read_sqlite(output)) == 31
+    logger.info("Old checkpoint test passed")
+
+
+def test_resume_refuses_missing_output():
+    logger.info("Testing that resume refuses a checkpoint without its output...")
+    with _stub_summarizers(), tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.jsonl')
+        _write_corpus(source)
+        output = os.path.join(tmp, 'out.jsonl')
+        _interrupted_run(source, output, interrupt_after=2 * 12)
+
+        os.remove(output)
+        _expect_error(ValueError, batch_summarize.run, source, output, workers=1, resume=True)
+    logger.info("Missing output test passed")
+
+
+def test_resume_refuses_changed_settings():
+    logger.info("Testing that resume refuses a checkpoint made with other settings...")
+    with _stub_summarizers(), tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.jsonl')
+        other_source = os.path.join(tmp, 'other.jsonl')
+        _write_corpus(source)
+        _write_corpus(other_source)
+
+        for name in ['out.jsonl', 'out.db']:
+            output = os.path.join(tmp, name)
+            _interrupted_run(source, output, interrupt_after=2 * 12)
+            for changed in [{'ratio': 0.5}, {'method': 'extractive'}, {'id_field': 'key'}]:
+                error = _expect_error(ValueError, batch_summarize.run, source, output,
+                                      workers=1, resume=True, **changed)
+                assert list(changed)[0] in str(error)
+            _expect_error(ValueError, batch_summarize.run, other_source, output, workers=1, resume=True)
+
+            # Unchanged settings still resume
+            assert batch_summarize.run(source, output, workers=1, batch_size=5, resume=True) == 31
+    logger.info("Changed settings test passed")
+
+
+def test_invalid_worker_count():
+    logger.info("Testing that an invalid worker count leaves the output alone...")
+    with _stub_summarizers(), tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.jsonl')
+        _write_corpus(source)
+        output = os.path.join(tmp, 'out.jsonl')
+        batch_summarize.run(source, output, workers=1)
+        before = _read_jsonl(output)
+
+        for workers in [0, -1]:
+            _expect_error(ValueError, batch_summarize.run, source, output, workers=workers)
+            error = _expect_error(SystemExit, batch_summarize.main, [source, output, '--workers', str(workers)])
+            assert error.code == 2
+        assert _read_jsonl(output) == before
+        assert os.path.exists(output + '.checkpoint')
+    logger.info("Invalid worker count test passed")
+
+
+def test_abstractive_failure_is_recorded():
+    logger.info("Testing that abstractive failures are recorded as errors...")
+    with _stub_summarizers():
+        _load_stub_summarizers('both')
+        result = batch_summarize._summarize_document('doc', 'This will fail.', 0.3)
+        assert result['error'] == 'abstractive summarization failed'
+        assert result['abstractive'] is None
+        assert result['extractive'] == 'extractive: This will fail.'
+    logger.info("Abstractive failure test passed")
+
+
+def test_summarizer_setup_errors():
+    logger.info("Testing summarizer setup errors...")
+
+    def failing_loader(method):
+        raise LookupError("Resource punkt not found")
+
+    with _stub_summarizers(failing_loader), tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.jsonl')
+        _write_corpus(source)
+        output = os.path.join(tmp, 'out.jsonl')
+
+        # Setup errors in the main process stop the run before any output is written
+        _expect_error(LookupError, batch_summarize.run, source, output, workers=2)
+        assert not os.path.exists(output)
+
+        # Setup errors in a worker stop the run instead of marking documents as done
+        batch_summarize._init_worker('both')
+        error = _expect_error(RuntimeError, batch_summarize._summarize_document, 'doc', 'Some text.', 0.3)
+        assert str(error) == 'Failed to load summarizers: Resource punkt not found'
+    logger.info("Setup error test passed")
+
+
+def test_worker_setup_error_stops_pool_run():
+    # Workers only see the stub summarizers when they are forked
+    if multiprocessing.get_start_method() != 'fork':
+        logger.info("Skipping worker setup error test: requires the fork start method")
+        return
+
+    logger.info("Testing that a worker setup error stops a pool run...")
+    parent = os.getpid()
+
+    def worker_failing_loader(method):
+        if os.getpid() != parent:
+            raise LookupError("Resource punkt not found")
+        _load_stub_summarizers(method)
+
+    with _stub_summarizers(worker_failing_loader), tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.jsonl')
+        _write_corpus(source)
+        output = os.path.join(tmp, 'out.jsonl')
+
+        _expect_error(RuntimeError, batch_summarize.run, source, output, workers=2, batch_size=5)
+        assert _read_jsonl(output) == []
+        assert not os.path.exists(output + '.checkpoint')
+    logger.info("Worker setup error test passed")
+
+
+def test_worker_pool_jsonl_and_sqlite():
+    # Workers only see the stub summarizers when they are forked
+    if multiprocessing.get_start_method() != 'fork':
+        logger.info("Skipping worker pool test: requires the fork start method")
+        return
+
+    logger.info("Testing worker pool output to JSONL and SQLite...")
+    with _stub_summarizers(), tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.jsonl')
+        _write_corpus(source)
+
+        batch_summarize.run(source, os.path.join(tmp, 'serial.jsonl'), workers=1)
+        batch_summarize.run(source, os.path.join(tmp, 'pool.jsonl'), workers=3, batch_size=4)
+        batch_summarize.run(source, os.path.join(tmp, 'pool.db'), workers=3, batch_size=4)
+
+        serial = _read_jsonl(os.path.join(tmp, 'serial.jsonl'))
+        assert _read_jsonl(os.path.join(tmp, 'pool.jsonl')) == serial
+        assert _read_sqlite(os.path.join(tmp, 'pool.db')) == _as_rows(serial)
+    logger.info("Worker pool test passed")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_jsonl_interrupt_and_resume,
+        test_sqlite_interrupt_and_resume,
+        test_duplicate_ids_are_kept,
+        test_fresh_run_discards_old_checkpoint,
+        test_resume_refuses_missing_output,
+        test_resume_refuses_changed_settings,
+        test_invalid_worker_count,
+        test_abstractive_failure_is_recorded,
+        test_summarizer_setup_errors,
+        test_worker_setup_error_stops_pool_run,
+        test_worker_pool_jsonl_and_sqlite,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception:
+            logger.error(f"{test.__name__} failed")
+            traceback.print_exc()
+            failed += 1
+    logger.info(f"Batch summarization tests completed: {len(tests) - failed} passed, {failed} failed")
+    raise SystemExit(1 if failed else 0)
@@ -0,0 +1,182 @@
+import json
+import logging
+import re
+import sys
+import traceback
+from contextlib import contextmanager
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                    handlers=[logging.StreamHandler()])
+logger = logging.getLogger(__name__)
+
+
+class StubSummarizer:
+    """Fast, deterministic stand-in so the checks run without NLTK data."""
+
+    ERROR_SUMMARY = "Error generating summary. Please try again."
+    calls = 0
+
+    def __init__(self, name='stub'):
+        self.name = name
+        self.fail = False
+
+    def summarize(self, text, ratio=0.3):
+        StubSummarizer.calls += 1
+        if self.fail:
+            return self.ERROR_SUMMARY
+        return f"{self.name}: {text[:20]}"
+
+    def chunk_text(self, text, max_chunk_size=1000):
+        # Same greedy packing as AbstractiveTextSummarizer.chunk_text, on a simple sentence split
+        chunks, current, size = [], [], 0
+        for sentence in re.split(r'(?<=\.)\s+', text.strip()):
+            if current and size + len(sentence) > max_chunk_size:
+                chunks.append(' '.join(current))
+                current, size = [], 0
+            current.append(sentence)
+            size += len(sentence)
+        if current:
+            chunks.append(' '.join(current))
+        return chunks
+
+
+def _import_app():
+    """Import the Flask app without building the real summarizers, which need NLTK data."""
+    if 'app' in sys.modules:
+        return sys.modules['app']
+
+    import models.extractive
+    import models.abstractive
+    originals = (models.extractive.ExtractiveTextSummarizer, models.abstractive.AbstractiveTextSummarizer)
+    models.extractive.ExtractiveTextSummarizer = StubSummarizer
+    models.abstractive.AbstractiveTextSummarizer = StubSummarizer
+    try:
+        import app
+    finally:
+        models.extractive.ExtractiveTextSummarizer, models.abstractive.AbstractiveTextSummarizer = originals
+    return app
+
+
+@contextmanager
+def _stub_summarizers():
+    """Swap stub summarizers into the app for one test, restoring the originals afterwards."""
+    app = _import_app()
+    originals = (app.extractive_summarizer, app.abstractive_summarizer)
+    app.extractive_summarizer = StubSummarizer('extractive')
+    app.abstractive_summarizer = StubSummarizer('abstractive')
+    StubSummarizer.calls = 0
+    try:
+        yield app
+    finally:
+        app.extractive_summarizer, app.abstractive_summarizer = originals
+
+
+def _long_text(sentences=12):
+    # Each sentence is about 100 characters, so a 500 character chunk holds four or five
+    return ' '.join(f"Sentence number {i} talks about the topic at some length to fill out the chunk nicely {'x' * 10}."
+                    for i in range(sentences))
+
+
+def _parse(events):
+    """Turn encoded Server-Sent Events into (event, data) pairs."""
+    parsed = []
+    for block in ''.join(events).split('\n\n'):
+        if not block:
+            continue
+        lines = dict(line.split(': ', 1) for line in block.split('\n'))
+        parsed.append((lines['event'], json.loads(lines['data'])))
+    return parsed
+
+
+def test_event_order():
+    logger.info("Testing streaming event order...")
+    with _stub_summarizers() as app:
+        text = _long_text()
+        events = _parse(app._stream_summaries(text, 'both', 0.3, 500))
+        total = len(app.abstractive_summarizer.chunk_text(text, max_chunk_size=500))
+        assert total > 1
+
+        expected = [('progress', 'chunking')]
+        for i in range(1, total + 1):
+            expected += [('progress', 'chunk'), ('partial', 'extractive'), ('partial', 'abstractive')]
+        expected += [('progress', 'extractive'), ('summary', 'extractive'),
+                     ('progress', 'abstractive'), ('summary', 'abstractive'), ('done', None)]
+        actual = [(event, data.get('stage', data.get('method'))) for event, data in events]
+        assert actual == expected
+
+        partials = [data for event, data in events if event == 'partial']
+        assert [p['chunk'] for p in partials if p['method'] == 'extractive'] == list(range(1, total + 1))
+        # The final summary comes from the whole text, not the joined previews
+        summary = [data for event, data in events if event == 'summary'][0]
+        assert summary['summary'] == app.extractive_summarizer.summarize(text)
+    logger.info("Event order test passed")
+
+
+def test_single_chunk_has_no_partials():
+    logger.info("Testing that single-chunk text sends no partial events...")
+    with _stub_summarizers() as app:
+        events = _parse(app._stream_summaries('A short text. Only two sentences.', 'extractive', 0.3, 2000))
+        assert [event for event, _ in events] == ['progress', 'progress', 'summary', 'done']
+    logger.info("Single chunk test passed")
+
+
+def test_failed_summary_sends_error():
+    logger.info("Testing that a failure placeholder becomes an error event...")
+    with _stub_summarizers() as app:
+        app.abstractive_summarizer.fail = True
+        events = _parse(app._stream_summaries(_long_text(), 'both', 0.3, 500))
+        assert events[-1][0] == 'error'
+        assert all(data.get('summary') != StubSummarizer.ERROR_SUMMARY for _, data in events)
+        assert 'done' not in [event for event, _ in events]
+    logger.info("Failed summary test passed")
+
+
+def test_chunk_size_validation():
+    logger.info("Testing chunk_size validation...")
+    with _stub_summarizers() as app:
+        client = app.app.test_client()
+        for chunk_size in [0, -5, 499, 10001, 'abc', 1500.5, True, None]:
+            response = client.post('/summarize/stream', json={'text': 'Some text.', 'chunk_size': chunk_size})
+            assert response.status_code == 400, chunk_size
+        for chunk_size in [500, 10000]:
+            response = client.post('/summarize/stream', json={'text': 'Some text.', 'chunk_size': chunk_size})
+            assert response.status_code == 200
+            assert response.mimetype == 'text/event-stream'
+            assert response.get_data(as_text=True).endswith('event: done\ndata: {}\n\n')
+            response.close()
+    logger.info("chunk_size validation test passed")
+
+
+def test_disconnect_stops_work():
+    logger.info("Testing that closing the stream stops further summarization...")
+    with _stub_summarizers() as app:
+        stream = app._stream_summaries(_long_text(), 'both', 0.3, 500)
+        for event in stream:
+            if event.startswith('event: partial'):
+                break
+        calls = StubSummarizer.calls
+        stream.close()
+        assert StubSummarizer.calls == calls == 1
+    logger.info("Disconnect test passed")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_event_order,
+        test_single_chunk_has_no_partials,
+        test_failed_summary_sends_error,
+        test_chunk_size_validation,
+        test_disconnect_stops_work,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception:
+            logger.error(f"{test.__name__} failed")
+            traceback.print_exc()
+            failed += 1
+    logger.info(f"Streaming tests completed: {len(tests) - failed} passed, {failed} failed")
+    raise SystemExit(1 if failed else 0)